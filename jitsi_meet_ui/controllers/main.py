@@ -10,12 +10,13 @@ class JitsiController(http.Controller):
         """Public meeting join page - anyone with link can join"""
         # Find meeting by room code
         meeting = request.env['jitsi.meeting'].sudo().search([('room_name', '=', room)], limit=1)
-        server = request.env['ir.config_parameter'].sudo().get_param('jitsi.server.url') or 'https://meet.jit.si'
+        server = request.env['jitsi.meeting']._get_jitsi_config().get('jitsi.server_url') or 'https://meet.jit.si'
         
         # Get current user info (if authenticated)
         user = request.env.user
-        user_name = user.name if user and user.id != request.env.ref('base.public_user').id else 'Guest'
-        user_email = user.email if user and user.id != request.env.ref('base.public_user').id else ''
+        is_public = not user or user._is_public()
+        user_name = 'Guest' if is_public else user.name
+        user_email = '' if is_public else user.email
         
         # Check if user is meeting owner (becomes moderator)
         is_moderator = meeting and user.id == meeting.owner_id.id
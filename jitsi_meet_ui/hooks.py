@@ -4,6 +4,8 @@ import logging
 
 _logger = logging.getLogger(__name__)
 
+UNINSTALL_BATCH_SIZE = 1000
+
 def post_init_hook(env):
     # placeholder: could create demo data or config parameters
     # Odoo calls post_init_hook with the registry/env in newer versions
@@ -21,10 +23,17 @@ def uninstall_hook(env):
         # fallback: try to use env as-is
         pass
     try:
-        meetings = env['jitsi.meeting'].search([])
-        if meetings:
-            count = len(meetings)
+        # Unlink in batches so large tables don't load into memory at once
+        Meeting = env['jitsi.meeting'].with_context(
+            active_test=False, tracking_disable=True, mail_notrack=True)
+        count = 0
+        while True:
+            meetings = Meeting.search([], limit=UNINSTALL_BATCH_SIZE)
+            if not meetings:
+                break
+            count += len(meetings)
             meetings.unlink()
+        if count:
             _logger.info('jitsi_meet_ui: removed %d meetings on uninstall', count)
     except Exception:
         _logger.exception('jitsi_meet_ui: error during uninstall cleanup')
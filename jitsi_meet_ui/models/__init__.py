@@ -2,3 +2,4 @@
 from . import jitsi_meeting
 from . import calendar_event
 from . import res_config_settings
+from . import ir_config_parameter
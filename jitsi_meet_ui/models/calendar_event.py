@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+from collections import defaultdict
+
 from odoo import models, fields, api, _
 
 
@@ -20,6 +22,8 @@ class CalendarEvent(models.Model):
     def _compute_videocall_location(self):
         """Override to add Jitsi meeting URL"""
         jitsi_events = self.filtered(lambda e: e.videocall_source == 'jitsi' and e.jitsi_meeting_id)
+        # Load every linked meeting URL in one query before assigning
+        jitsi_events.jitsi_meeting_id.fetch(['meeting_url'])
         for event in jitsi_events:
             event.videocall_location = event.jitsi_meeting_id.meeting_url
         
@@ -44,9 +48,9 @@ class CalendarEvent(models.Model):
             
             # Add attendees from calendar event
             if self.partner_ids:
-                users = self.env['res.users'].search([('partner_id', 'in', self.partner_ids.ids)])
-                if users:
-                    meeting_vals['attendee_ids'] = [(6, 0, users.ids)]
+                user_ids = list(self.env['res.users']._search([('partner_id', 'in', self.partner_ids.ids)]))
+                if user_ids:
+                    meeting_vals['attendee_ids'] = [(6, 0, user_ids)]
             
             meeting = JitsiMeeting.create(meeting_vals)
             self.jitsi_meeting_id = meeting.id
@@ -82,9 +86,10 @@ class CalendarEvent(models.Model):
                 if not event.jitsi_meeting_id:
                     event.action_create_jitsi_meeting()
         
-        # Update linked Jitsi meeting details
-        for event in self:
-            if event.jitsi_meeting_id and any(k in vals for k in ['name', 'start', 'stop']):
+        # Update linked Jitsi meeting details, one write per distinct set of values
+        if any(k in vals for k in ['name', 'start', 'stop']):
+            meetings_by_vals = defaultdict(lambda: self.env['jitsi.meeting'])
+            for event in self.filtered('jitsi_meeting_id'):
                 meeting_vals = {}
                 if 'name' in vals:
                     meeting_vals['name'] = event.name
@@ -92,8 +97,11 @@ class CalendarEvent(models.Model):
                     meeting_vals['start_datetime'] = event.start
                 if 'stop' in vals and event.start:
                     meeting_vals['duration'] = (event.stop - event.start).total_seconds() / 3600.0
-                
+
                 if meeting_vals:
-                    event.jitsi_meeting_id.write(meeting_vals)
-        
+                    meetings_by_vals[tuple(sorted(meeting_vals.items()))] |= event.jitsi_meeting_id
+
+            for meeting_vals, meetings in meetings_by_vals.items():
+                meetings.write(dict(meeting_vals))
+
         return res
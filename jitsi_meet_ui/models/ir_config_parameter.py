@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+from odoo import api, models
+
+
+class IrConfigParameter(models.Model):
+    _inherit = 'ir.config_parameter'
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        params = super().create(vals_list)
+        if any(vals.get('key') == 'web.base.url' for vals in vals_list):
+            self.env['jitsi.meeting']._recompute_meeting_urls()
+        return params
+
+    def write(self, vals):
+        """Refresh stored meeting links when web.base.url changes"""
+        touched = 'web.base.url' in self.mapped('key')
+        res = super().write(vals)
+        if touched or vals.get('key') == 'web.base.url':
+            self.env['jitsi.meeting']._recompute_meeting_urls()
+        return res
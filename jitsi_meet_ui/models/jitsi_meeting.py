@@ -1,10 +1,44 @@
 # -*- coding: utf-8 -*-
+import functools
 import uuid
 import jwt
 import time
-from odoo import api, fields, models, _
+from odoo import api, fields, models, tools, _
 from odoo.exceptions import ValidationError
 
+# Tokens are valid for two hours; issuing them on a one-minute grid lets
+# repeated joins of the same user to the same room reuse one signature.
+JWT_LIFETIME = 7200
+JWT_ISSUE_WINDOW = 60
+
+# Keys set by hand before the settings screen existed. When present they
+# win over the settings, whose domain default would otherwise mask them.
+LEGACY_CONFIG_KEYS = {
+    'jitsi.server.url': 'jitsi.server_url',
+    'jitsi.server.domain': 'jitsi.server_domain',
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _encode_jwt(app_id, app_secret, domain, room, user_name, user_email, is_moderator, issued_at):
+    payload = {
+        'iss': app_id,
+        'aud': app_id,
+        'exp': issued_at + JWT_LIFETIME,
+        'nbf': issued_at - 10,
+        'sub': domain,
+        'room': room,
+        'context': {
+            'user': {
+                'name': user_name,
+                'email': user_email,
+                'moderator': 'true' if is_moderator else 'false',
+            },
+        },
+    }
+    token = jwt.encode(payload, app_secret, algorithm='HS256')
+    return token if isinstance(token, str) else token.decode('utf-8')
+
 
 class JitsiMeeting(models.Model):
     _name = 'jitsi.meeting'
@@ -22,8 +56,12 @@ class JitsiMeeting(models.Model):
     duration = fields.Integer(string='Duration (minutes)', default=60)
     owner_id = fields.Many2one('res.users', string='Organizer', default=lambda self: self.env.user, required=True)
     attendee_ids = fields.Many2many('res.users', string='Attendees')
-    meeting_url = fields.Char(string='Meeting Link', compute='_compute_meeting_url', store=False)
-    join_url = fields.Char(string='Join URL', compute='_compute_meeting_url', store=False)
+    # Stored so list views and calendar events read a column instead of
+    # recomputing. The value embeds web.base.url, which is not a field
+    # dependency: ir.config_parameter recomputes every meeting when that
+    # parameter changes (see _recompute_meeting_urls).
+    meeting_url = fields.Char(string='Meeting Link', compute='_compute_meeting_url', store=True)
+    join_url = fields.Char(string='Join URL', compute='_compute_meeting_url', store=True)
     active = fields.Boolean(default=True)
     state = fields.Selection([
         ('draft', 'Draft'),
@@ -39,6 +77,13 @@ class JitsiMeeting(models.Model):
             rec.meeting_url = f"{base_url}/o-meet/join/{rec.room_name}"
             rec.join_url = rec.meeting_url
 
+    @api.model
+    def _recompute_meeting_urls(self):
+        """Queue the stored meeting links of all meetings for recomputation."""
+        meetings = self.sudo().with_context(active_test=False).search([])
+        self.env.add_to_compute(self._fields['meeting_url'], meetings)
+        self.env.add_to_compute(self._fields['join_url'], meetings)
+
     @api.model
     def create_instant_meeting(self):
         """Create and immediately return a ready-to-join instant meeting"""
@@ -86,35 +131,43 @@ class JitsiMeeting(models.Model):
             }
         }
 
+    @api.model
+    @tools.ormcache()
+    def _get_jitsi_config(self):
+        """Return every jitsi.* system parameter as a {key: value} dict.
+
+        All keys are read in one query and cached; ir.config_parameter clears
+        the cache whenever a parameter changes. Callers must not modify it.
+        """
+        params = self.env['ir.config_parameter'].sudo().search_read(
+            [('key', '=like', 'jitsi.%')], ['key', 'value'])
+        config = {param['key']: param['value'] for param in params}
+        for legacy_key, key in LEGACY_CONFIG_KEYS.items():
+            if config.get(legacy_key):
+                config[key] = config[legacy_key]
+        return config
+
     def generate_jwt_token(self, user_name, user_email, is_moderator=True):
         """Generate JWT token for Jitsi authentication (if configured)"""
-        ICP = self.env['ir.config_parameter'].sudo()
-        app_id = ICP.get_param('jitsi.jwt.app_id', '')
-        app_secret = ICP.get_param('jitsi.jwt.app_secret', '')
+        config = self._get_jitsi_config()
+        app_id = config.get('jitsi.jwt.app_id', '')
+        app_secret = config.get('jitsi.jwt.app_secret', '')
         
         if not app_id or not app_secret:
             # No JWT configured, return None (will use public meet.jit.si)
             return None
         
         now = int(time.time())
-        payload = {
-            'iss': app_id,
-            'aud': app_id,
-            'exp': now + 7200,  # Token valid for 2 hours
-            'nbf': now - 10,
-            'sub': ICP.get_param('jitsi.server.domain', 'meet.jit.si'),
-            'room': self.room_name,
-            'context': {
-                'user': {
-                    'name': user_name,
-                    'email': user_email,
-                    'moderator': 'true' if is_moderator else 'false',
-                },
-            },
-        }
-        
-        token = jwt.encode(payload, app_secret, algorithm='HS256')
-        return token if isinstance(token, str) else token.decode('utf-8')
+        return _encode_jwt(
+            app_id,
+            app_secret,
+            config.get('jitsi.server_domain', 'meet.jit.si'),
+            self.room_name,
+            user_name,
+            user_email,
+            bool(is_moderator),
+            now - now % JWT_ISSUE_WINDOW,
+        )
 
     @api.constrains('room_name')
     def _check_room_name(self):
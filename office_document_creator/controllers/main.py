@@ -1,74 +1,110 @@
 # -*- coding: utf-8 -*-
-import base64
+import collections
 import logging
 import os
+from werkzeug.exceptions import NotFound
 from odoo import http, _
 from odoo.http import request
 
 _logger = logging.getLogger(__name__)
 
-TEMPLATE_MAP = {
-    'word': ('blank.docx', 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'),
-    'excel': ('blank.xlsx', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'),
-    'powerpoint': ('blank.pptx', 'application/vnd.openxmlformats-officedocument.presentationml.presentation'),
+DocSpec = collections.namedtuple('DocSpec', 'raw path mimetype base_name')
+
+_TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'static', 'templates')
+
+# Templates larger than this are read from disk on use rather than kept in
+# every worker's memory
+_TEMPLATE_CACHE_MAX_SIZE = 1 << 20
+
+
+def _load_template(template_file):
+    """Locate a blank template in static/templates and return (raw, path).
+
+    raw holds the file bytes when the template is small enough to keep in
+    memory and is None otherwise. Both are None if the file is missing.
+    """
+    template_path = os.path.join(_TEMPLATES_DIR, template_file)
+    try:
+        size = os.path.getsize(template_path)
+    except OSError:
+        _logger.error('Template file not found: %s', template_path)
+        return None, None
+    if size > _TEMPLATE_CACHE_MAX_SIZE:
+        return None, template_path
+    with open(template_path, 'rb') as f:
+        return f.read(), template_path
+
+
+# Blank templates never change at runtime, so they are located (and, when
+# small, read) once at import
+_DOC_SPEC = {
+    'word': DocSpec(
+        *_load_template('blank.docx'),
+        'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+        'Untitled Document',
+    ),
+    'excel': DocSpec(
+        *_load_template('blank.xlsx'),
+        'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+        'Untitled Spreadsheet',
+    ),
+    'powerpoint': DocSpec(
+        *_load_template('blank.pptx'),
+        'application/vnd.openxmlformats-officedocument.presentationml.presentation',
+        'Untitled Presentation',
+    ),
 }
 
+
 class OfficeController(http.Controller):
 
+    def _create_document(self, doc_type):
+        """Create a blank document of doc_type for the current user.
+
+        Returns the (document, attachment) pair. Raises NotFound for an
+        unknown doc_type or a missing template before touching the ORM.
+        """
+        spec = _DOC_SPEC.get(doc_type)
+        if spec is None:
+            raise NotFound('Invalid document type')
+        if spec.path is None:
+            raise NotFound('Template not found')
+        raw = spec.raw
+        if raw is None:
+            with open(spec.path, 'rb') as f:
+                raw = f.read()
+        
+        name = request.env['office.document']._next_unique_name(spec.base_name, request.env.user.id)
+        
+        # Attachment and document are created together or not at all; the
+        # savepoint also flushes both INSERTs and the res_id UPDATE in one go
+        with request.env.cr.savepoint():
+            attachment = request.env['ir.attachment'].create([{
+                'name': name,
+                'raw': raw,
+                'mimetype': spec.mimetype,
+                'res_model': 'office.document',
+            }])
+            document = request.env['office.document'].create([{
+                'name': name,
+                'document_type': doc_type,
+                'attachment_id': attachment.id,
+                'owner_id': request.env.user.id,
+            }])
+            # Link attachment to document
+            attachment.write({'res_id': document.id})
+        
+        return document, attachment
+
     @http.route('/office/create/<string:doc_type>', type='http', auth='user', methods=['GET'])
     def create_document(self, doc_type, **kwargs):
         """Create a new blank document"""
-        if doc_type not in TEMPLATE_MAP:
-            return request.render('http_routing.404')
-        
-        template_file, mimetype = TEMPLATE_MAP[doc_type]
-        
-        # Get template file path
-        module_path = os.path.dirname(os.path.dirname(__file__))
-        template_path = os.path.join(module_path, 'static', 'templates', template_file)
-        
-        if not os.path.exists(template_path):
-            _logger.error(f'Template file not found: {template_path}')
+        try:
+            document, _attachment = self._create_document(doc_type)
+        except NotFound:
             return request.render('http_routing.404')
         
-        # Read template file
-        with open(template_path, 'rb') as f:
-            file_data = f.read()
-        
-        # Generate unique name
-        doc_names = {
-            'word': 'Untitled Document',
-            'excel': 'Untitled Spreadsheet',
-            'powerpoint': 'Untitled Presentation',
-        }
-        base_name = doc_names.get(doc_type, 'Untitled')
-        count = 1
-        name = base_name
-        
-        while request.env['office.document'].search([('name', '=', name), ('owner_id', '=', request.env.user.id)], limit=1):
-            name = f'{base_name} {count}'
-            count += 1
-        
-        # Create attachment
-        attachment = request.env['ir.attachment'].create({
-            'name': name,
-            'datas': base64.b64encode(file_data),
-            'mimetype': mimetype,
-            'res_model': 'office.document',
-        })
-        
-        # Create document
-        document = request.env['office.document'].create({
-            'name': name,
-            'document_type': doc_type,
-            'attachment_id': attachment.id,
-            'owner_id': request.env.user.id,
-        })
-        
-        # Link attachment to document
-        attachment.res_id = document.id
-        
-        _logger.info(f'Created new {doc_type} document: {name} (ID: {document.id})')
+        _logger.info('Created new %s document: %s (ID: %s)', doc_type, document.name, document.id)
         
         # Redirect to document list with notification
         return request.redirect(f'/web#action=office_document_creator.action_office_document&active_id={document.id}')
@@ -76,57 +112,13 @@ class OfficeController(http.Controller):
     @http.route('/office/quick_create', type='json', auth='user', methods=['POST'])
     def quick_create_document(self, doc_type, **kwargs):
         """JSON endpoint for quick create (used by buttons)"""
-        if doc_type not in TEMPLATE_MAP:
-            return {'error': 'Invalid document type'}
-        
-        template_file, mimetype = TEMPLATE_MAP[doc_type]
-        
-        # Get template file path
-        module_path = os.path.dirname(os.path.dirname(__file__))
-        template_path = os.path.join(module_path, 'static', 'templates', template_file)
-        
-        if not os.path.exists(template_path):
-            return {'error': 'Template not found'}
-        
-        # Read template file
-        with open(template_path, 'rb') as f:
-            file_data = f.read()
-        
-        # Generate unique name
-        doc_names = {
-            'word': 'Untitled Document',
-            'excel': 'Untitled Spreadsheet',
-            'powerpoint': 'Untitled Presentation',
-        }
-        base_name = doc_names.get(doc_type, 'Untitled')
-        count = 1
-        name = base_name
-        
-        while request.env['office.document'].search([('name', '=', name), ('owner_id', '=', request.env.user.id)], limit=1):
-            name = f'{base_name} {count}'
-            count += 1
-        
-        # Create attachment
-        attachment = request.env['ir.attachment'].create({
-            'name': name,
-            'datas': base64.b64encode(file_data),
-            'mimetype': mimetype,
-            'res_model': 'office.document',
-        })
-        
-        # Create document
-        document = request.env['office.document'].create({
-            'name': name,
-            'document_type': doc_type,
-            'attachment_id': attachment.id,
-            'owner_id': request.env.user.id,
-        })
-        
-        # Link attachment to document
-        attachment.res_id = document.id
+        try:
+            document, attachment = self._create_document(doc_type)
+        except NotFound as e:
+            return {'error': e.description}
         
         return {
             'document_id': document.id,
-            'name': name,
+            'name': document.name,
             'attachment_id': attachment.id,
         }
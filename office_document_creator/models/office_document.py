@@ -7,10 +7,12 @@ import mimetypes
 from datetime import datetime, timedelta
 from odoo import api, fields, models, _
 from odoo.exceptions import UserError, ValidationError
-from odoo.modules.module import get_module_resource
+from odoo.tools.sql import create_index, drop_index, make_index_name
 
 _logger = logging.getLogger(__name__)
 
+_TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'static', 'templates')
+
 # Document types supported by OnlyOffice
 DOCUMENT_TYPES = [
     ('word', 'Word Document'),
@@ -102,7 +104,7 @@ class OfficeDocument(models.Model):
         string='Document Name',
         required=True,
         tracking=True,
-        index=True,
+        index='trigram',
     )
     document_type = fields.Selection(
         selection=DOCUMENT_TYPES,
@@ -207,8 +209,27 @@ class OfficeDocument(models.Model):
     tags = fields.Char(
         string='Tags',
         help='Comma-separated tags for better search',
+        index='trigram',
     )
     
+    def init(self):
+        super().init()
+        # Serves the per-owner name lookups (uniqueness checks, _next_unique_name)
+        create_index(self.env.cr, 'office_document_owner_name_idx', self._table, ['owner_id', 'name'])
+        # name used to carry a btree index under the same name the ORM gives
+        # the trigram one; drop it so the registry rebuilds it as GIN. Without
+        # pg_trgm trigram indexes are skipped, so keep the btree in that case.
+        if self.env.registry.has_trigram:
+            name_index = make_index_name(self._table, 'name')
+            self.env.cr.execute("""
+                SELECT 1
+                  FROM pg_class c
+                  JOIN pg_am am ON am.oid = c.relam
+                 WHERE c.relname = %s AND c.relkind = 'i' AND am.amname != 'gin'
+            """, (name_index,))
+            if self.env.cr.rowcount:
+                drop_index(self.env.cr, name_index, self._table)
+
     @api.depends('attachment_id.file_size')
     def _compute_file_size(self):
         for record in self:
@@ -243,6 +264,32 @@ class OfficeDocument(models.Model):
             if not record.name or not record.name.strip():
                 raise ValidationError(_('Document name cannot be empty.'))
 
+    @api.model
+    def _next_unique_name(self, base_name, owner_id):
+        """Return the first free name among base_name, 'base_name 1', 'base_name 2', ...
+
+        All of the owner's candidate names are fetched in a single query
+        instead of probing each suffix with its own search.
+        """
+        self.flush_model(['name', 'owner_id'])
+        like_prefix = base_name.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        self.env.cr.execute(
+            "SELECT name FROM office_document WHERE owner_id = %s AND (name = %s OR name LIKE %s)",
+            (owner_id, base_name, like_prefix + ' %'),
+        )
+        used = set()
+        for (name,) in self.env.cr.fetchall():
+            suffix = name[len(base_name) + 1:]
+            if name == base_name:
+                used.add(0)
+            elif suffix.isascii() and suffix.isdigit() and not suffix.startswith('0'):
+                used.add(int(suffix))
+
+        count = 0
+        while count in used:
+            count += 1
+        return f'{base_name} {count}' if count else base_name
+
     @api.model
     def create_document_from_template(self, doc_type, folder_id=False):
         """Create a new document from template (called via ORM).
@@ -269,10 +316,9 @@ class OfficeDocument(models.Model):
         
         template_file, mimetype, file_ext = TEMPLATE_MAP[doc_type]
         
-        # Get template file path using Odoo helper
-        template_path = get_module_resource('office_document_creator', 'static', 'templates', template_file)
+        template_path = os.path.join(_TEMPLATES_DIR, template_file)
         
-        if not template_path or not os.path.exists(template_path):
+        if not os.path.exists(template_path):
             raise UserError(_('Template file not found: %s') % template_file)
         
         # Read template file
@@ -297,7 +343,7 @@ class OfficeDocument(models.Model):
         attachment_name = f"{name}{file_ext}"
         attachment = self.env['ir.attachment'].create({
             'name': attachment_name,
-            'datas': base64.b64encode(file_data),
+            'raw': file_data,
             'mimetype': mimetype,
             'res_model': 'office.document',
             'public': True,
@@ -332,11 +378,18 @@ class OfficeDocument(models.Model):
         if not self.attachment_id:
             raise UserError(_('No file attached to this document.'))
         
-        # Update access tracking
-        self.sudo().write({
-            'last_accessed': fields.Datetime.now(),
-            'access_count': self.access_count + 1,
-        })
+        # Update access tracking with an atomic increment instead of a full ORM
+        # write (no tracking, no recompute, no lost updates on concurrent opens)
+        self.flush_recordset(['last_accessed', 'access_count', 'write_date', 'write_uid'])
+        now = fields.Datetime.now()
+        self.env.cr.execute(
+            """UPDATE office_document
+                  SET last_accessed = %s, access_count = access_count + 1,
+                      write_date = %s, write_uid = %s
+                WHERE id = %s""",
+            (now, now, self.env.uid, self.id),
+        )
+        self.invalidate_recordset(['last_accessed', 'access_count', 'write_date', 'write_uid'])
         
         url = f'/onlyoffice/editor/{self.attachment_id.id}'
         
@@ -350,7 +403,6 @@ class OfficeDocument(models.Model):
         """Create a copy of the document"""
         self.ensure_one()
         
-        original_data = base64.b64decode(self.attachment_id.datas)
         _template_file, _mimetype, file_ext = TEMPLATE_MAP.get(self.document_type, ('', '', '.docx'))
         
         copy_number = 1
@@ -366,7 +418,7 @@ class OfficeDocument(models.Model):
         attachment_name = f"{new_name}{file_ext}"
         new_attachment = self.env['ir.attachment'].create({
             'name': attachment_name,
-            'datas': base64.b64encode(original_data),
+            'raw': self.attachment_id.raw,
             'mimetype': self.attachment_id.mimetype,
             'res_model': 'office.document',
             'public': True,
@@ -383,7 +435,7 @@ class OfficeDocument(models.Model):
         
         new_attachment.res_id = new_document.id
         
-        _logger.info(f'Document duplicated: {self.name} -> {new_name}')
+        _logger.info('Document duplicated: %s -> %s', self.name, new_name)
         
         return {
             'type': 'ir.actions.client',
@@ -665,7 +717,7 @@ class OfficeDocument(models.Model):
         attachment_name = f"{name}{file_ext}"
         attachment = self.env['ir.attachment'].create({
             'name': attachment_name,
-            'datas': base64.b64encode(file_data) if isinstance(file_data, bytes) else file_data,
+            'raw': file_data,
             'mimetype': mimetype or 'application/octet-stream',
             'res_model': 'office.document',
             'public': True,
@@ -842,7 +894,7 @@ class OfficeDocument(models.Model):
         ])
         count = len(old_trash)
         old_trash.unlink()
-        _logger.info(f'Auto-deleted {count} documents from trash (older than 30 days)')
+        _logger.info('Auto-deleted %s documents from trash (older than 30 days)', count)
         return count
 
 
@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+from collections import defaultdict
+
 from odoo import api, fields, models, _
 from odoo.exceptions import ValidationError
 
@@ -64,11 +66,13 @@ class OfficeFolder(models.Model):
 
     @api.depends('document_ids')
     def _compute_document_count(self):
+        counts = dict(self.env['office.document']._read_group(
+            [('folder_id', 'in', self.ids), ('is_trashed', '=', False)],
+            ['folder_id'],
+            ['__count'],
+        ))
         for record in self:
-            record.document_count = self.env['office.document'].search_count([
-                ('folder_id', '=', record.id),
-                ('is_trashed', '=', False),
-            ])
+            record.document_count = counts.get(record, 0)
 
     @api.constrains('parent_id')
     def _check_parent_recursion(self):
@@ -131,18 +135,22 @@ class OfficeFolder(models.Model):
     @api.model
     def get_folder_tree(self, parent_id=False):
         """Get folder tree structure for navigation"""
-        domain = [('owner_id', '=', self.env.user.id), ('parent_id', '=', parent_id)]
-        folders = self.search(domain, order='name')
-        result = []
+        # Load all of the user's folders in one query and assemble the tree in memory
+        folders = self.search([('owner_id', '=', self.env.user.id)], order='name')
+        children = defaultdict(list)
         for folder in folders:
-            result.append({
+            children[folder.parent_id.id].append(folder)
+
+        def build(parent):
+            return [{
                 'id': folder.id,
                 'name': folder.name,
                 'document_count': folder.document_count,
-                'children': self.get_folder_tree(folder.id),
+                'children': build(folder.id),
                 'is_starred': folder.is_starred,
-            })
-        return result
+            } for folder in children[parent]]
+
+        return build(parent_id)
 
     @api.model
     def get_folder_path(self, folder_id):
@@ -161,9 +169,17 @@ class OfficeFolder(models.Model):
         if not folder_id:
             return []
             
-        path = []
-        folder = self.browse(folder_id).exists()
-        while folder:
-            path.insert(0, {'id': folder.id, 'name': folder.name})
-            folder = folder.parent_id
-        return path
+        # Collect the ancestors in one recursive query instead of one per level
+        self.flush_model(['parent_id'])
+        self.env.cr.execute("""
+            WITH RECURSIVE ancestors(id, parent_id, depth) AS (
+                SELECT id, parent_id, 0 FROM office_folder WHERE id = %s
+                UNION ALL
+                SELECT f.id, f.parent_id, a.depth + 1
+                  FROM office_folder f
+                  JOIN ancestors a ON f.id = a.parent_id
+            )
+            SELECT id FROM ancestors ORDER BY depth DESC
+        """, (folder_id,))
+        folders = self.browse([row[0] for row in self.env.cr.fetchall()])
+        return [{'id': folder.id, 'name': folder.name} for folder in folders]